@@ -10,17 +10,17 @@ router = APIRouter()
 @router.post(
     "/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED
 )
-def register(
+async def register(
     user_create: UserCreate,
     user_service = Depends(get_user_service),
 ):
     """用户注册"""
-    user = user_service.create_user(user_create)
+    user = await user_service.create_user(user_create)
     return user
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     user_service = Depends(get_user_service),
@@ -30,7 +30,7 @@ def login(
     client_ip = request.client.host if request.client else "unknown"
 
     # 验证用户
-    user = user_service.authenticate_user(form_data.username, form_data.password)
+    user = await user_service.authenticate_user(form_data.username, form_data.password)
 
     # 生成访问令牌，传递IP地址
     access_token = user_service.generate_token(user, ip_address=client_ip)
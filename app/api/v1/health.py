@@ -4,6 +4,7 @@ from sqlalchemy import text
 from app.dependencies.database import get_sqlite_db
 from app.dependencies.rate_limit import limiter
 from app.dependencies.auth import auth_deps
+from app.infrastructure.database.sqlite.connection import read_pragmas
 from app.config.logger import logger
 
 # 创建健康检查路由
@@ -47,10 +48,13 @@ def readiness_check(request: Request, db: Session = Depends(get_sqlite_db)):
     logger.info("Readiness check called")
     
     # 检查数据库连接
+    db_settings = {}
     try:
         # 执行简单的SQL查询来测试数据库连接
         db.execute(text("SELECT 1"))
         db_status = "ok"
+        # 报告实际生效的SQLite性能配置
+        db_settings = read_pragmas(db)
     except Exception as e:
         logger.error(f"Database connection check failed: {str(e)}")
         db_status = "error"
@@ -64,4 +68,7 @@ def readiness_check(request: Request, db: Session = Depends(get_sqlite_db)):
         "checks": {
             "database": db_status,
         },
+        "details": {
+            "database": db_settings,
+        },
     }
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from typing import List, Literal, Optional
 from pydantic import BaseModel
-from app.domains.user.schemas.user import UserCreate, UserResponse, Token
+from app.domains.user.schemas.user import UserCreate, UserResponse, UserPage, Token
 from app.domains.user.services.user_service import UserService
 from app.dependencies.service import get_user_service
 from app.dependencies.auth import get_current_user
 from app.config.settings import app_settings
+from app.utils.streaming import aiter_ndjson, aiter_records, detect_format
 
 router = APIRouter()
 
@@ -17,22 +19,22 @@ class LoginRequest(BaseModel):
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register_user(
+async def register_user(
     user_in: UserCreate,
     user_service: UserService = Depends(get_user_service)
 ):
     """用户注册"""
-    user = user_service.create_user(user_in)
+    user = await user_service.create_user(user_in)
     return UserResponse.model_validate(user)
 
 
 @router.post("/login", response_model=Token)
-def login_user(
+async def login_user(
     login_request: LoginRequest,
     user_service: UserService = Depends(get_user_service)
 ):
     """用户登录"""
-    user = user_service.authenticate_user(login_request.username, login_request.password)
+    user = await user_service.authenticate_user(login_request.username, login_request.password)
     access_token = user_service.generate_token(user)
     return Token(
         access_token=access_token,
@@ -41,8 +43,45 @@ def login_user(
     )
 
 
+@router.get("", response_model=UserPage)
+async def list_users(
+    limit: int = Query(app_settings.PAGE_SIZE_DEFAULT, ge=1, le=app_settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = Query(None, description="上一页返回的next_cursor"),
+    order_by: Literal["id", "created_at"] = "id",
+    order: Literal["asc", "desc"] = "asc",
+    include_total: bool = Query(False, description="是否返回近似总数"),
+    current_user = Depends(get_current_user),
+    user_service: UserService = Depends(get_user_service)
+):
+    """游标分页获取用户列表"""
+    return await user_service.list_users(
+        limit=limit,
+        cursor=cursor,
+        order_by=order_by,
+        descending=order == "desc",
+        include_total=include_total,
+    )
+
+
+@router.post("/bulk")
+async def bulk_import_users(
+    request: Request,
+    current_user = Depends(get_current_user),
+    user_service: UserService = Depends(get_user_service)
+):
+    """批量导入用户
+
+    请求体为流式上传的NDJSON（application/x-ndjson）或带表头的CSV（text/csv），
+    每条记录包含username、email、password。响应为NDJSON流，逐行返回导入结果，
+    最后一行为汇总。
+    """
+    records = aiter_records(request.stream(), detect_format(request.headers.get("content-type")))
+    results = user_service.import_users(records, chunk_size=app_settings.USER_IMPORT_CHUNK_SIZE)
+    return StreamingResponse(aiter_ndjson(results), media_type="application/x-ndjson")
+
+
 @router.get("/me", response_model=UserResponse)
-def get_current_user(
+async def get_current_user(
     current_user = Depends(get_current_user)
 ):
     """获取当前用户信息"""
@@ -50,9 +89,9 @@ def get_current_user(
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-def get_user(
+async def get_user(
     user_id: int,
     user_service: UserService = Depends(get_user_service)
 ):
     """根据ID获取用户"""
-    return user_service.get_user(user_id)
+    return await user_service.get_user(user_id)
@@ -1,5 +1,5 @@
 from app.config.base import BaseSettings
-from typing import Optional
+from typing import Optional, Dict, Any
 
 
 class SQLiteConfig(BaseSettings):
@@ -15,11 +15,51 @@ class SQLiteConfig(BaseSettings):
     # SQLAlchemy配置
     ECHO_SQL: bool = False
 
+    # 数据库访问模式：sync（同步引擎，经线程池执行）或async（aiosqlite异步引擎）
+    ENGINE_MODE: str = "sync"
+
+    # 读写分离配置
+    READ_POOL_SIZE: int = 4  # 只读连接池大小
+    WRITE_QUEUE_SIZE: int = 1000  # 单写入器队列容量，队列满时写操作阻塞等待
+
+    # 组提交配置 - 聚合窗口内的多个写操作共享一个事务（一次提交）
+    GROUP_COMMIT_ENABLED: bool = True
+    GROUP_COMMIT_MAX_OPS: int = 64  # 每批最多写操作数
+    GROUP_COMMIT_LINGER_MS: float = 2.0  # 聚合等待时间（毫秒）
+
+    # 性能配置 - 每个连接建立时通过PRAGMA应用，None表示保持SQLite默认值
+    BUSY_TIMEOUT: Optional[int] = 5000  # 锁等待超时（毫秒）
+    JOURNAL_MODE: Optional[str] = "WAL"  # DELETE, TRUNCATE, PERSIST, MEMORY, WAL, OFF
+    SYNCHRONOUS: Optional[str] = "NORMAL"  # OFF, NORMAL, FULL, EXTRA
+    WAL_AUTOCHECKPOINT: Optional[int] = 1000  # WAL自动检查点页数
+    CACHE_SIZE: Optional[int] = -64000  # 页缓存大小，负数表示KiB（-64000约为64MB）
+    MMAP_SIZE: Optional[int] = 256 * 1024 * 1024  # 内存映射大小（字节）
+    TEMP_STORE: Optional[str] = "MEMORY"  # DEFAULT, FILE, MEMORY
+
     @property
     def URL(self) -> str:
         """生成SQLite连接URL"""
         return f"sqlite:///{self.DATABASE_FILE}"
 
+    @property
+    def ASYNC_URL(self) -> str:
+        """生成SQLite异步连接URL（aiosqlite驱动）"""
+        return f"sqlite+aiosqlite:///{self.DATABASE_FILE}"
+
+    @property
+    def PRAGMAS(self) -> Dict[str, Any]:
+        """需要在连接上应用的PRAGMA，按应用顺序排列"""
+        pragmas = {
+            "busy_timeout": self.BUSY_TIMEOUT,
+            "journal_mode": self.JOURNAL_MODE,
+            "synchronous": self.SYNCHRONOUS,
+            "wal_autocheckpoint": self.WAL_AUTOCHECKPOINT,
+            "cache_size": self.CACHE_SIZE,
+            "mmap_size": self.MMAP_SIZE,
+            "temp_store": self.TEMP_STORE,
+        }
+        return {name: value for name, value in pragmas.items() if value is not None}
+
     model_config = BaseSettings.model_config.copy()
     model_config["env_prefix"] = "SQLITE_"
 
@@ -30,6 +30,25 @@ class AppSettings(BaseSettings):
     SECRET_KEY: str = "your-secret-key"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    JWT_CACHE_SIZE: int = 10000  # 已验证令牌缓存容量
+    JWT_NEGATIVE_CACHE_SIZE: int = 1000  # 被拒绝令牌缓存容量
+    JWT_NEGATIVE_CACHE_TTL: float = 30.0  # 被拒绝令牌缓存有效期（秒）
+
+    # 密码哈希配置
+    PASSWORD_HASH_WORKERS: Optional[int] = None  # 哈希进程池大小，None表示使用CPU核数
+    PASSWORD_HASH_MAX_PENDING: int = 64  # 最大排队任务数，超出时快速失败返回503
+
+    # 认证用户缓存配置
+    PRINCIPAL_CACHE_SIZE: int = 10000  # 最大缓存用户数
+    PRINCIPAL_CACHE_TTL: float = 60.0  # 缓存有效期（秒）
+
+    # 分页配置
+    PAGE_SIZE_DEFAULT: int = 20  # 列表接口默认每页数量
+    PAGE_SIZE_MAX: int = 100  # 列表接口最大每页数量
+    USER_TOTAL_CACHE_TTL: float = 30.0  # 用户总数缓存有效期（秒），总数为近似值
+
+    # 批量导入配置
+    USER_IMPORT_CHUNK_SIZE: int = 500  # 每次批量插入的用户数
 
     # 配置文件优先级
     model_config = BaseSettings.model_config.copy()
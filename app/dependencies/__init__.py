@@ -13,6 +13,9 @@ from app.dependencies.config import (
 # 数据库依赖
 from app.dependencies.database import (
     get_sqlite_db,
+    get_sqlite_writer,
+    get_async_sqlite_db,
+    get_async_sqlite_write_db,
 )
 
 # 认证依赖
@@ -34,6 +37,9 @@ __all__ = [
     "get_logging_config",
     # 数据库依赖
     "get_sqlite_db",
+    "get_sqlite_writer",
+    "get_async_sqlite_db",
+    "get_async_sqlite_write_db",
     # 认证依赖
     "get_current_user",
     "oauth2_scheme",
@@ -1,9 +1,12 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from jose import JWTError, jwt
+from jose import JWTError
 from app.dependencies.config import get_app_settings
-from app.dependencies.database import get_sqlite_db
+from app.dependencies.database import sqlite_connection
+from app.dependencies.repository import get_user_repository
+from app.infrastructure.cache.principal import PrincipalCache
+from app.utils.jwt import verify_access_token
+from app.utils.concurrency import run_maybe_async
 from app.config.logger import logger
 
 
@@ -13,20 +16,42 @@ oauth2_scheme = OAuth2PasswordBearer(
 )
 
 
-def get_current_user(
+def load_user(user_id: int):
+    """使用独立会话加载用户，用于认证用户缓存预热"""
+    # 延迟导入，避免循环导入
+    from app.domains.user.models.user import User
+
+    session_gen = sqlite_connection.get_session()
+    db = next(session_gen)
+    try:
+        return db.query(User).filter(User.id == user_id).first()
+    finally:
+        session_gen.close()
+
+
+# 认证用户缓存实例
+principal_cache = PrincipalCache(
+    maxsize=get_app_settings().PRINCIPAL_CACHE_SIZE,
+    ttl=get_app_settings().PRINCIPAL_CACHE_TTL,
+    loader=load_user,
+)
+
+
+async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_sqlite_db),
+    user_repository = Depends(get_user_repository),
 ):
     """获取当前认证用户
 
-    验证JWT令牌，获取用户信息并验证用户状态
+    验证JWT令牌，获取用户信息并验证用户状态。
+    用户快照优先从认证用户缓存读取，未命中时才查询数据库。
 
     Args:
         token: JWT令牌
-        db: 数据库会话
+        user_repository: 用户仓储（会话惰性连接，缓存命中时不会访问数据库）
 
     Returns:
-        当前认证用户对象
+        当前认证用户快照（UserPrincipal）
 
     Raises:
         HTTPException: 认证失败时返回401错误
@@ -38,11 +63,8 @@ def get_current_user(
     )
 
     try:
-        # 解码JWT令牌
-        settings = get_app_settings()
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        # 解码JWT令牌（同一令牌只验证一次签名）
+        payload = verify_access_token(token)
         user_id: str = payload.get("sub")
         if user_id is None:
             logger.warning("JWT token missing 'sub' claim")
@@ -51,16 +73,18 @@ def get_current_user(
         logger.warning(f"JWT token decoding failed: {str(e)}")
         raise credentials_exception
 
-    # 延迟导入，避免循环导入
-    from app.domains.user.models.user import User
-    
-    # 直接使用Session查询用户，避免依赖UserService
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    # 优先从缓存获取用户快照
+    principal = principal_cache.get_principal(int(user_id))
+    if principal is not None:
+        return principal
+
+    # 缓存未命中时通过仓储查询用户，兼容同步和异步仓储
+    user = await run_maybe_async(user_repository.get, int(user_id))
     if user is None:
         logger.warning(f"User not found for ID: {user_id}")
         raise credentials_exception
 
-    return user
+    return principal_cache.put(user)
 
 
 # 认证依赖注入容器
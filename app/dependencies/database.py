@@ -1,6 +1,7 @@
 from fastapi import Depends
 from app.infrastructure.database.base import DatabaseConnection
 from app.infrastructure.database.sqlite.connection import SQLiteConnection
+from app.infrastructure.database.sqlite.async_connection import AsyncSQLiteConnection
 
 
 class DatabaseManager:
@@ -35,14 +36,34 @@ database_manager = DatabaseManager()
 # 创建SQLite连接实例并注册
 sqlite_connection = SQLiteConnection()
 database_manager.register("sqlite", sqlite_connection)
+# 创建SQLite异步连接实例并注册
+async_sqlite_connection = AsyncSQLiteConnection()
+database_manager.register("sqlite_async", async_sqlite_connection)
 
 
 # 依赖注入函数 - 用于FastAPI Depends
 def get_sqlite_db():
-    """SQLite数据库会话依赖注入"""
+    """SQLite数据库会话依赖注入（只读）"""
     yield from sqlite_connection.get_session()
 
 
+def get_sqlite_writer():
+    """SQLite单写入器依赖注入，仓储的写操作通过它串行提交"""
+    return sqlite_connection.writer
+
+
+async def get_async_sqlite_db():
+    """SQLite异步数据库会话依赖注入（只读）"""
+    async for session in async_sqlite_connection.get_session():
+        yield session
+
+
+async def get_async_sqlite_write_db():
+    """SQLite异步写会话依赖注入"""
+    async for session in async_sqlite_connection.get_write_session():
+        yield session
+
+
 # 依赖注入容器 - 用于FastAPI Depends
 class DatabaseDeps:
     """数据库依赖注入容器，提供统一的依赖注入接口"""
@@ -51,6 +72,10 @@ class DatabaseDeps:
     def sqlite():
         return Depends(get_sqlite_db)
 
+    @staticmethod
+    def sqlite_async():
+        return Depends(get_async_sqlite_db)
+
 
 # 导出数据库依赖
 db_deps = DatabaseDeps()
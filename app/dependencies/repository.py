@@ -1,15 +1,40 @@
 from fastapi import Depends
-from app.dependencies.database import get_sqlite_db
+from app.config.database import sqlite_config
+from app.dependencies.database import (
+    get_sqlite_db,
+    get_sqlite_writer,
+    get_async_sqlite_db,
+    get_async_sqlite_write_db,
+)
 from app.infrastructure.repositories.sqlite.user_repository import SQLiteUserRepository
+from app.infrastructure.repositories.sqlite.async_user_repository import AsyncSQLiteUserRepository
 from app.domains.user.repositories.user_repository import UserRepositoryInterface
 
 
 # 依赖注入函数
-def get_sqlite_user_repository(db = Depends(get_sqlite_db)):
-    """SQLite用户仓储依赖注入"""
-    return SQLiteUserRepository(db)
+def get_sqlite_user_repository(
+    db = Depends(get_sqlite_db),
+    writer = Depends(get_sqlite_writer),
+):
+    """SQLite用户仓储依赖注入，读走只读会话，写走单写入器"""
+    return SQLiteUserRepository(db, writer=writer)
+
+
+async def get_async_sqlite_user_repository(
+    db = Depends(get_async_sqlite_db),
+    write_db = Depends(get_async_sqlite_write_db),
+):
+    """SQLite异步用户仓储依赖注入，读走只读会话，写走写会话"""
+    return AsyncSQLiteUserRepository(db, write_db=write_db)
+
+
+# 根据配置选择用户仓储实现（SQLITE_ENGINE_MODE=sync|async），便于对比两种数据库访问方式
+if sqlite_config.ENGINE_MODE == "async":
+    get_user_repository = get_async_sqlite_user_repository
+else:
+    get_user_repository = get_sqlite_user_repository
 
 # 导出仓储依赖，供服务层使用
 export_repo_deps = {
-    "user_repository": get_sqlite_user_repository
+    "user_repository": get_user_repository
 }
@@ -1,10 +1,10 @@
 from fastapi import Depends
 from app.domains.user.services.user_service import UserService
-from app.dependencies.repository import get_sqlite_user_repository
+from app.dependencies.repository import get_user_repository
 
 
 # 服务层依赖注入函数
-def get_user_service(user_repository = Depends(get_sqlite_user_repository)):
+def get_user_service(user_repository = Depends(get_user_repository)):
     """用户服务依赖注入"""
     return UserService(user_repository)
 
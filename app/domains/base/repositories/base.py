@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Any, Optional, List, Sequence, Tuple
 
 
 class BaseRepository(ABC):
@@ -14,3 +14,32 @@ class BaseRepository(ABC):
     def get_multi(self, skip: int = 0, limit: int = 100):
         """获取实体列表"""
         pass
+
+    @abstractmethod
+    def get_page(
+        self,
+        limit: int = 100,
+        after: Optional[Sequence[Any]] = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> Tuple[List[Any], Optional[Tuple[Any, ...]]]:
+        """基于键集（游标）分页获取实体列表
+
+        与offset分页不同，查询直接从上一页最后一条记录的排序键处继续扫描索引，
+        耗时与页码深度无关。
+
+        Args:
+            limit: 每页数量
+            after: 上一页返回的排序键，None表示第一页
+            order_by: 排序字段
+            descending: 是否降序
+
+        Returns:
+            (实体列表, 下一页的排序键)，没有下一页时排序键为None
+        """
+        pass
+
+    @abstractmethod
+    def count(self) -> int:
+        """统计实体总数"""
+        pass
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Index, Integer, String, DateTime
 from sqlalchemy.sql import func
 from app.domains.base.models.base import Base
 
@@ -7,6 +7,10 @@ class User(Base):
     """用户领域模型"""
 
     __tablename__ = "users"
+    # 插入/更新时通过RETURNING取回服务端默认值，避免额外的refresh查询
+    __mapper_args__ = {"eager_defaults": True}
+    # 按创建时间键集分页使用的复合索引
+    __table_args__ = (Index("ix_users_created_at_id", "created_at", "id"),)
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     username = Column(String(50), unique=True, index=True, nullable=False)
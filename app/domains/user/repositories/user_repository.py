@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Set, Tuple
 from app.domains.base.repositories.base import BaseRepository
 
 
@@ -21,6 +21,20 @@ class UserRepositoryInterface(BaseRepository):
         """创建用户"""
         pass
     
+    @abstractmethod
+    def find_existing(self, usernames: List[str], emails: List[str]) -> Tuple[Set[str], Set[str]]:
+        """批量查询已存在的用户名和邮箱
+
+        Returns:
+            (已存在的用户名集合, 已存在的邮箱集合)
+        """
+        pass
+
+    @abstractmethod
+    def bulk_create(self, users_in: List[dict]) -> List[int]:
+        """批量创建用户，返回与输入顺序一致的用户ID列表"""
+        pass
+    
     @abstractmethod
     def update(self, user_id: int, user_in: any) -> Optional[any]:
         """更新用户"""
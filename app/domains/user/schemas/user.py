@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 class UserBase(BaseModel):
@@ -31,6 +31,13 @@ class UserResponse(UserBase):
         from_attributes = True
 
 
+class UserPage(BaseModel):
+    """用户分页响应模式"""
+    items: List[UserResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
 class Token(BaseModel):
     """令牌响应模式"""
     access_token: str
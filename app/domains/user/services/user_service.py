@@ -1,63 +1,243 @@
-from typing import Optional
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
 from app.domains.user.repositories.user_repository import UserRepositoryInterface
 from app.domains.user.schemas.user import UserCreate, UserUpdate
-from app.utils.password import get_password_hash, verify_password
+from app.utils.password import hash_password_async, verify_password_async, password_hasher
 from app.utils.jwt import create_access_token
+from app.utils.concurrency import run_maybe_async
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.infrastructure.cache import TTLCache
+from app.config.settings import app_settings
+from app.infrastructure.events import event_bus, UserLoggedInEvent
 from app.config.logger import logger
-from app.exception import BusinessException, AuthException, NotFoundException
+from app.exception import BusinessException, AuthException, NotFoundException, ValidationException
+
+# 用户总数缓存，列表接口返回的总数为近似值
+_user_total_cache = TTLCache(maxsize=1, ttl=app_settings.USER_TOTAL_CACHE_TTL)
 
 
 class UserService:
-    """用户服务"""
+    """用户服务
+
+    同时兼容同步仓储和异步仓储：仓储方法通过run_maybe_async调用，
+    同步实现在线程池中执行，异步实现直接在事件循环中等待。
+    """
 
     def __init__(self, user_repository: UserRepositoryInterface):
         self.user_repository = user_repository
 
-    def get_user(self, user_id: int) -> Optional[dict]:
+    async def get_user(self, user_id: int) -> Optional[dict]:
         """根据ID获取用户"""
-        user = self.user_repository.get(user_id)
+        user = await run_maybe_async(self.user_repository.get, user_id)
         if user:
             return user.__dict__  # 简单处理，实际应使用模型转换
         return None
 
-    def get_user_by_username(self, username: str) -> Optional[dict]:
+    async def list_users(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        order_by: str = "id",
+        descending: bool = False,
+        include_total: bool = False,
+    ) -> Dict[str, Any]:
+        """游标分页获取用户列表
+
+        游标中记录排序方式和上一页最后一条记录的排序键，
+        排序方式与当前请求不一致的游标视为无效。
+        """
+        after = None
+        if cursor:
+            try:
+                payload = decode_cursor(cursor)
+            except ValueError:
+                raise ValidationException(message="Invalid cursor")
+            if payload.get("o") != order_by or payload.get("d") != descending:
+                raise ValidationException(message="Cursor does not match the requested ordering")
+            after = payload.get("k")
+            if not isinstance(after, list):
+                raise ValidationException(message="Invalid cursor")
+
+        try:
+            users, next_key = await run_maybe_async(
+                self.user_repository.get_page, limit, after, order_by, descending
+            )
+        except ValueError as e:
+            raise ValidationException(message=str(e))
+
+        next_cursor = None
+        if next_key is not None:
+            next_cursor = encode_cursor({"o": order_by, "d": descending, "k": list(next_key)})
+
+        total = None
+        if include_total:
+            total = _user_total_cache.get("users")
+            if total is None:
+                total = await run_maybe_async(self.user_repository.count)
+                _user_total_cache.set("users", total)
+
+        return {
+            "items": [user.__dict__ for user in users],
+            "next_cursor": next_cursor,
+            "total": total,
+        }
+
+    async def get_user_by_username(self, username: str) -> Optional[dict]:
         """根据用户名获取用户"""
-        user = self.user_repository.get_by_username(username)
+        user = await run_maybe_async(self.user_repository.get_by_username, username)
         if user:
             return user.__dict__
         return None
 
-    def create_user(self, user_in: UserCreate) -> dict:
+    async def create_user(self, user_in: UserCreate) -> dict:
         """创建用户"""
         # 检查用户名是否已存在
-        existing_user = self.user_repository.get_by_username(user_in.username)
+        existing_user = await run_maybe_async(self.user_repository.get_by_username, user_in.username)
         if existing_user:
             logger.warning(f"User registration failed: username {user_in.username} already exists")
             raise BusinessException(message="Username already registered", code=409)
 
         # 检查邮箱是否已存在
-        existing_email = self.user_repository.get_by_email(user_in.email)
+        existing_email = await run_maybe_async(self.user_repository.get_by_email, user_in.email)
         if existing_email:
             logger.warning(f"User registration failed: email {user_in.email} already exists")
             raise BusinessException(message="Email already registered", code=409)
 
-        # 创建新用户
-        hashed_password = get_password_hash(user_in.password)
+        # 创建新用户，密码哈希在进程池中执行
+        hashed_password = await hash_password_async(user_in.password)
         user_data = user_in.model_dump(exclude={"password"})
         user_data["password_hash"] = hashed_password
         
-        user = self.user_repository.create(user_data)
+        user = await run_maybe_async(self.user_repository.create, user_data)
         logger.info(f"User registered successfully: {user_in.username}")
         return user.__dict__
 
-    def authenticate_user(self, username: str, password: str) -> Optional[dict]:
+    async def import_users(
+        self, records: AsyncIterable[Tuple[int, Any]], chunk_size: int = 500
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """批量导入用户，逐行产出导入结果
+
+        记录按chunk_size分块处理：每块用一次IN查询检查唯一性，
+        在进程池中并行计算密码哈希，再用executemany一次插入。
+
+        Args:
+            records: (行号, 记录字典或解析错误) 的异步迭代器
+            chunk_size: 每块记录数
+
+        Yields:
+            每行的导入结果，最后一项为汇总
+        """
+        created = failed = 0
+        chunk: List[Tuple[int, Any]] = []
+
+        async def flush() -> List[Dict[str, Any]]:
+            nonlocal created, failed
+            results = await self._import_chunk(chunk)
+            for result in results:
+                if result["status"] == "created":
+                    created += 1
+                else:
+                    failed += 1
+            chunk.clear()
+            return results
+
+        async for line_no, record in records:
+            chunk.append((line_no, record))
+            if len(chunk) >= chunk_size:
+                for result in await flush():
+                    yield result
+        if chunk:
+            for result in await flush():
+                yield result
+
+        logger.info(f"User import finished: {created} created, {failed} failed")
+        yield {"status": "summary", "created": created, "failed": failed}
+
+    async def _import_chunk(self, chunk: List[Tuple[int, Any]]) -> List[Dict[str, Any]]:
+        """导入一块用户记录"""
+        results: Dict[int, Dict[str, Any]] = {}
+        valid: List[Tuple[int, UserCreate]] = []
+        usernames, emails = set(), set()
+
+        def fail(line_no: int, error: str) -> None:
+            results[line_no] = {"line": line_no, "status": "error", "error": error}
+
+        # 校验格式并检查块内重复
+        for line_no, record in chunk:
+            if isinstance(record, Exception):
+                fail(line_no, str(record))
+                continue
+            try:
+                user_in = UserCreate.model_validate(record)
+            except ValidationError as e:
+                fail(line_no, "; ".join(
+                    f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()
+                ))
+                continue
+            if user_in.username in usernames:
+                fail(line_no, "Duplicate username in import")
+            elif user_in.email in emails:
+                fail(line_no, "Duplicate email in import")
+            else:
+                usernames.add(user_in.username)
+                emails.add(user_in.email)
+                valid.append((line_no, user_in))
+
+        # 一次查询检查整块数据与已有用户是否冲突
+        if valid:
+            existing_usernames, existing_emails = await run_maybe_async(
+                self.user_repository.find_existing, list(usernames), list(emails)
+            )
+            pending = []
+            for line_no, user_in in valid:
+                if user_in.username in existing_usernames:
+                    fail(line_no, "Username already registered")
+                elif user_in.email in existing_emails:
+                    fail(line_no, "Email already registered")
+                else:
+                    pending.append((line_no, user_in))
+            valid = pending
+
+        if valid:
+            hashes = await password_hasher.hash_many([user_in.password for _, user_in in valid])
+            rows = []
+            for (_, user_in), hashed_password in zip(valid, hashes):
+                user_data = user_in.model_dump(exclude={"password"})
+                user_data["password_hash"] = hashed_password
+                rows.append(user_data)
+            try:
+                ids = await run_maybe_async(self.user_repository.bulk_create, rows)
+            except IntegrityError:
+                # 检查之后有并发注册导致冲突，逐条插入以定位冲突的行
+                ids = []
+                for row in rows:
+                    try:
+                        user = await run_maybe_async(self.user_repository.create, row)
+                        ids.append(user.id)
+                    except IntegrityError:
+                        ids.append(None)
+            for (line_no, user_in), user_id in zip(valid, ids):
+                if user_id is None:
+                    fail(line_no, "Username or email already registered")
+                else:
+                    results[line_no] = {
+                        "line": line_no,
+                        "status": "created",
+                        "id": user_id,
+                        "username": user_in.username,
+                    }
+
+        return [results[line_no] for line_no, _ in chunk]
+
+    async def authenticate_user(self, username: str, password: str) -> Optional[dict]:
         """用户认证"""
-        user = self.user_repository.get_by_username(username)
+        user = await run_maybe_async(self.user_repository.get_by_username, username)
         if not user:
             logger.warning(f"Authentication failed: user {username} not found")
             raise AuthException(message="Incorrect username or password")
 
-        if not verify_password(password, user.password_hash):
+        if not await verify_password_async(password, user.password_hash):
             logger.warning(f"Authentication failed: incorrect password for user {username}")
             raise AuthException(message="Incorrect username or password")
 
@@ -71,4 +251,10 @@ class UserService:
             data={"sub": str(user["id"]), "username": user["username"]}
         )
         logger.info(f"Generated access token for user: {user['username']}")
+        # 发布用户登录事件
+        event_bus.publish(
+            UserLoggedInEvent(
+                user_id=user["id"], username=user["username"], ip_address=ip_address
+            )
+        )
         return access_token
\ No newline at end of file
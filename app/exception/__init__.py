@@ -1,7 +1,7 @@
 from app.exception.base import BaseAppException
 from app.exception.business import BusinessException, NotFoundException
 from app.exception.auth import AuthException, ForbiddenException
-from app.exception.http import ValidationException
+from app.exception.http import ValidationException, ServiceUnavailableException
 from app.exception.database import DatabaseException
 from app.exception.handler import custom_exception_handler
 from app.exception.response import ResponseBuilder
@@ -10,3 +10,14 @@ class ValidationException(BaseAppException):
         log_level: str = "info"
     ):
         super().__init__(message, code, error_details, log_level)
+
+class ServiceUnavailableException(BaseAppException):
+    """服务暂不可用异常（过载保护等场景）"""
+    def __init__(
+        self,
+        message: str = "服务繁忙，请稍后重试",
+        code: int = 503,
+        error_details: dict = None,
+        log_level: str = "warning"
+    ):
+        super().__init__(message, code, error_details, log_level)
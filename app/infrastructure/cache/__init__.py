@@ -0,0 +1,10 @@
+from .lru import TTLCache
+from .principal import UserPrincipal, PrincipalCache
+
+__all__ = [
+    # 通用缓存
+    "TTLCache",
+    # 认证用户缓存
+    "UserPrincipal",
+    "PrincipalCache",
+]
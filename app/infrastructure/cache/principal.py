@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from app.infrastructure.cache.lru import TTLCache
+from app.infrastructure.events.event import Event
+from app.config.logger import logger
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """已认证用户的只读快照，用于缓存和请求上下文"""
+
+    id: int
+    username: str
+    email: str
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_user(cls, user: Any) -> "UserPrincipal":
+        """从用户ORM对象创建快照"""
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+class PrincipalCache(TTLCache):
+    """认证用户缓存，按用户ID缓存用户快照
+
+    通过事件总线失效：用户更新/删除时移除缓存，用户登录时预热缓存。
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        ttl: float = 60.0,
+        loader: Optional[Callable[[int], Optional[Any]]] = None,
+    ):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        # 预热时用于加载用户的函数，参数为用户ID，返回用户对象或None
+        self.loader = loader
+
+    def get_principal(self, user_id: int) -> Optional[UserPrincipal]:
+        """获取缓存的用户快照"""
+        return self.get(user_id)
+
+    def put(self, user: Any) -> UserPrincipal:
+        """缓存用户对象并返回其快照"""
+        principal = user if isinstance(user, UserPrincipal) else UserPrincipal.from_user(user)
+        self.set(principal.id, principal)
+        return principal
+
+    def invalidate(self, user_id: int) -> None:
+        """使指定用户的缓存失效"""
+        self.pop(user_id)
+
+    def handle_user_changed(self, event: Event) -> None:
+        """处理用户更新/删除事件，使缓存失效"""
+        user_id = event.data.get("user_id")
+        if user_id is not None:
+            self.invalidate(user_id)
+
+    def handle_user_logged_in(self, event: Event) -> None:
+        """处理用户登录事件，预热缓存"""
+        user_id = event.data.get("user_id")
+        if user_id is None or self.loader is None:
+            return
+        user = self.loader(user_id)
+        if user is not None:
+            self.put(user)
+            logger.debug(f"Principal cache warmed for user ID: {user_id}")
@@ -0,0 +1,132 @@
+import asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.config.database import sqlite_config
+from app.infrastructure.database.base import DatabaseConnection
+from app.infrastructure.database.sqlite.connection import apply_pragmas
+from app.config.logger import logger
+from app.domains.base.models.base import Base
+
+
+class AsyncSQLiteConnection(DatabaseConnection):
+    """SQLite异步数据库连接管理（基于SQLAlchemy asyncio扩展和aiosqlite）
+
+    读写分离：读会话使用多连接只读连接池；写会话使用只有一个连接的写引擎，
+    并发写操作在连接池上排队等待，依次执行。
+    """
+
+    def __init__(self):
+        self._engine = None
+        self._read_engine = None
+        self._SessionLocal = None
+        self._WriteSessionLocal = None
+        self._Base = Base
+
+    def _create_engine(self, pragmas, **kwargs):
+        """创建应用了PRAGMA配置的SQLite异步引擎"""
+        engine = create_async_engine(
+            sqlite_config.ASYNC_URL, echo=sqlite_config.ECHO_SQL, **kwargs
+        )
+        # 每个新连接建立时应用性能相关的PRAGMA
+        event.listen(
+            engine.sync_engine,
+            "connect",
+            lambda dbapi_connection, connection_record: apply_pragmas(
+                dbapi_connection, pragmas
+            ),
+        )
+        return engine
+
+    def connect(self):
+        """创建SQLite异步引擎
+
+        异步引擎只能在事件循环中建立连接，这里仅创建引擎和会话工厂，
+        首次使用会话时才会真正建立连接。
+        """
+        try:
+            pragmas = sqlite_config.PRAGMAS
+            # 写引擎：单连接，并发写操作排队等待
+            self._engine = self._create_engine(
+                pragmas, pool_size=1, max_overflow=0, pool_timeout=60
+            )
+            # 读引擎：多连接只读连接池
+            self._read_engine = self._create_engine(
+                {**pragmas, "query_only": "ON"},
+                pool_size=sqlite_config.READ_POOL_SIZE,
+                max_overflow=0,
+            )
+            self._SessionLocal = async_sessionmaker(
+                self._read_engine, autoflush=False, expire_on_commit=False
+            )
+            self._WriteSessionLocal = async_sessionmaker(
+                self._engine, autoflush=False, expire_on_commit=False
+            )
+            logger.info("SQLite异步引擎创建成功")
+        except Exception as e:
+            logger.error(f"SQLite异步引擎创建失败: {str(e)}")
+            raise
+
+    async def dispose(self):
+        """异步释放连接池"""
+        if self._engine:
+            engine, self._engine = self._engine, None
+            read_engine, self._read_engine = self._read_engine, None
+            self._SessionLocal = None
+            self._WriteSessionLocal = None
+            await read_engine.dispose()
+            await engine.dispose()
+            logger.info("SQLite异步连接已断开")
+
+    def disconnect(self):
+        """断开SQLite异步连接
+
+        在事件循环中调用时调度异步释放任务，建议在异步代码中直接 await dispose()。
+        """
+        if not self._engine:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.dispose())
+        else:
+            loop.create_task(self.dispose())
+
+    async def get_session(self):
+        """获取SQLite异步只读会话"""
+        if not self._SessionLocal:
+            self.connect()
+        async with self._SessionLocal() as session:
+            yield session
+
+    # 只读会话的显式别名
+    get_read_session = get_session
+
+    async def get_write_session(self):
+        """获取SQLite异步写会话"""
+        if not self._WriteSessionLocal:
+            self.connect()
+        async with self._WriteSessionLocal() as session:
+            yield session
+
+    @property
+    def engine(self):
+        """获取SQLite异步写引擎"""
+        if not self._engine:
+            self.connect()
+        return self._engine
+
+    @property
+    def read_engine(self):
+        """获取SQLite异步只读引擎"""
+        if not self._read_engine:
+            self.connect()
+        return self._read_engine
+
+    @property
+    def Base(self):
+        """获取SQLite模型基类"""
+        return self._Base
+
+
+# SQLite异步连接实例
+async_sqlite_connection = AsyncSQLiteConnection()
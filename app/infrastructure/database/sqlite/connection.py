@@ -1,31 +1,134 @@
-from sqlalchemy import create_engine, text
+from typing import Any, Dict, Iterable
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 from app.config.database import sqlite_config
 from app.infrastructure.database.base import DatabaseConnection
+from app.infrastructure.database.sqlite.writer import SQLiteWriter
 from app.config.logger import logger
 from app.domains.base.models.base import Base
 
 
+# PRAGMA数值结果与名称的映射，用于展示实际生效的配置
+_PRAGMA_VALUE_NAMES = {
+    "synchronous": {0: "OFF", 1: "NORMAL", 2: "FULL", 3: "EXTRA"},
+    "temp_store": {0: "DEFAULT", 1: "FILE", 2: "MEMORY"},
+}
+
+# 就绪检查中报告的PRAGMA
+REPORTED_PRAGMAS = (
+    "journal_mode",
+    "synchronous",
+    "busy_timeout",
+    "wal_autocheckpoint",
+    "cache_size",
+    "mmap_size",
+    "temp_store",
+)
+
+
+def apply_pragmas(dbapi_connection, pragmas: Dict[str, Any]) -> None:
+    """在DBAPI连接上应用PRAGMA配置"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def enable_explicit_transactions(engine, begin_statement: str = "BEGIN") -> None:
+    """让SQLAlchemy显式发出BEGIN语句
+
+    pysqlite驱动默认自行管理事务，导致SAVEPOINT无法正常工作。
+    关闭驱动的事务管理后由SQLAlchemy发出BEGIN（写连接使用BEGIN IMMEDIATE，
+    事务开始时即获取写锁）。
+    """
+    @event.listens_for(engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql(begin_statement)
+
+
+def read_pragmas(connection, names: Iterable[str] = REPORTED_PRAGMAS) -> Dict[str, Any]:
+    """读取连接上实际生效的PRAGMA值
+
+    Args:
+        connection: SQLAlchemy连接或会话
+        names: 需要读取的PRAGMA名称
+    """
+    values = {}
+    for name in names:
+        value = connection.execute(text(f"PRAGMA {name}")).scalar()
+        values[name] = _PRAGMA_VALUE_NAMES.get(name, {}).get(value, value)
+    return values
+
+
 class SQLiteConnection(DatabaseConnection):
-    """SQLite数据库连接管理"""
+    """SQLite数据库连接管理
+
+    读写分离：
+    - 读操作使用多连接的只读连接池（PRAGMA query_only），可并行执行
+    - 写操作通过SQLiteWriter提交到专用写线程，在唯一的写连接上串行执行
+    """
 
     def __init__(self):
         self._engine = None
+        self._read_engine = None
         self._SessionLocal = None
+        self._WriteSessionLocal = None
+        self._writer = None
         self._Base = Base
 
+    def _create_engine(self, pragmas, **kwargs):
+        """创建应用了PRAGMA配置的SQLite引擎"""
+        engine = create_engine(
+            sqlite_config.URL,
+            connect_args={
+                "check_same_thread": False
+            },  # SQLite特定配置，允许在多线程中使用
+            echo=sqlite_config.ECHO_SQL,
+            **kwargs,
+        )
+        # 每个新连接建立时应用性能相关的PRAGMA
+        event.listen(
+            engine,
+            "connect",
+            lambda dbapi_connection, connection_record: apply_pragmas(
+                dbapi_connection, pragmas
+            ),
+        )
+        return engine
+
     def connect(self):
         """建立SQLite连接"""
         try:
-            self._engine = create_engine(
-                sqlite_config.URL,
-                connect_args={
-                    "check_same_thread": False
-                },  # SQLite特定配置，允许在多线程中使用
-                echo=sqlite_config.ECHO_SQL
+            pragmas = sqlite_config.PRAGMAS
+            # 写引擎：只有一个连接，由写线程独占（同时用于建表等DDL操作）
+            self._engine = self._create_engine(pragmas, pool_size=1, max_overflow=0)
+            # 组提交依赖SAVEPOINT隔离每个写操作
+            enable_explicit_transactions(self._engine, "BEGIN IMMEDIATE")
+            # 读引擎：多连接只读连接池
+            self._read_engine = self._create_engine(
+                {**pragmas, "query_only": "ON"},
+                pool_size=sqlite_config.READ_POOL_SIZE,
+                max_overflow=0,
             )
             self._SessionLocal = sessionmaker(
-                autocommit=False, autoflush=False, bind=self._engine
+                autocommit=False, autoflush=False, bind=self._read_engine
+            )
+            # 写会话提交后不过期对象，写操作返回的对象在写线程外仍可访问
+            self._WriteSessionLocal = sessionmaker(
+                autocommit=False, autoflush=False, expire_on_commit=False, bind=self._engine
+            )
+            self._writer = SQLiteWriter(
+                self._WriteSessionLocal,
+                max_queue_size=sqlite_config.WRITE_QUEUE_SIZE,
+                group_commit=sqlite_config.GROUP_COMMIT_ENABLED,
+                max_batch=sqlite_config.GROUP_COMMIT_MAX_OPS,
+                linger_ms=sqlite_config.GROUP_COMMIT_LINGER_MS,
             )
             # 测试连接
             with self._engine.connect() as conn:
@@ -37,13 +140,21 @@ class SQLiteConnection(DatabaseConnection):
 
     def disconnect(self):
         """断开SQLite连接"""
+        if self._writer:
+            self._writer.stop()
+            self._writer = None
+        if self._read_engine:
+            self._read_engine.dispose()
+            self._read_engine = None
         if self._engine:
             self._engine.dispose()
             self._engine = None
+            self._SessionLocal = None
+            self._WriteSessionLocal = None
             logger.info("SQLite连接已断开")
 
     def get_session(self):
-        """获取SQLite会话"""
+        """获取SQLite只读会话"""
         if not self._SessionLocal:
             self.connect()
         db = self._SessionLocal()
@@ -52,13 +163,44 @@ class SQLiteConnection(DatabaseConnection):
         finally:
             db.close()
 
+    # 只读会话的显式别名
+    get_read_session = get_session
+
+    def get_write_session(self):
+        """获取SQLite写会话
+
+        写会话直接使用写连接，仅用于无法通过写线程提交的场景，
+        常规写操作应使用 writer.execute()。
+        """
+        if not self._WriteSessionLocal:
+            self.connect()
+        db = self._WriteSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @property
+    def writer(self) -> SQLiteWriter:
+        """获取单写入器"""
+        if not self._writer:
+            self.connect()
+        return self._writer
+
     @property
     def engine(self):
-        """获取SQLite引擎"""
+        """获取SQLite写引擎"""
         if not self._engine:
             self.connect()
         return self._engine
 
+    @property
+    def read_engine(self):
+        """获取SQLite只读引擎"""
+        if not self._read_engine:
+            self.connect()
+        return self._read_engine
+
     @property
     def Base(self):
         """获取SQLite模型基类"""
@@ -0,0 +1,190 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.config.logger import logger
+from app.infrastructure.metrics import Histogram
+
+# 停止写线程的哨兵
+_STOP = object()
+
+# 批次大小与聚合等待时间（毫秒）的直方图分桶
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+LINGER_MS_BUCKETS = (0.1, 0.5, 1, 2, 5, 10, 25, 50, 100)
+
+
+class SQLiteWriter:
+    """SQLite单写入器
+
+    SQLite同一时刻只允许一个写事务。所有写操作以 func(session) 的形式提交到队列，
+    由专用写线程在唯一的写连接上依次执行并提交，写冲突变为排队而不是锁重试。
+
+    开启组提交后，写线程会把聚合窗口（linger）内到达的多个写操作（最多max_batch个）
+    放到同一个事务中执行，每个操作使用独立的SAVEPOINT，失败只回滚该操作本身，
+    整批只提交一次（一次fsync），每个调用方仍然各自拿到自己的结果或异常。
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_queue_size: int = 1000,
+        group_commit: bool = False,
+        max_batch: int = 64,
+        linger_ms: float = 0.0,
+        name: str = "sqlite-writer",
+    ):
+        self._session_factory = session_factory
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self.group_commit = group_commit
+        self.max_batch = max(1, max_batch)
+        self.linger = max(0.0, linger_ms) / 1000
+        self._name = name
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        # 统计指标
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._commits = 0
+        self.batch_size_histogram = Histogram(BATCH_SIZE_BUCKETS)
+        self.linger_ms_histogram = Histogram(LINGER_MS_BUCKETS)
+
+    def start(self) -> None:
+        """启动写线程"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """停止写线程，已提交的写操作会先执行完"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+    def submit(self, func: Callable[[Session], Any]) -> Future:
+        """提交写操作，队列已满时阻塞等待
+
+        Args:
+            func: 写操作函数，接收写会话作为参数，无需自行提交事务
+
+        Returns:
+            写操作结果的Future
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Cannot submit a write from inside the writer thread")
+        self.start()
+        future: Future = Future()
+        with self._lock:
+            self._submitted += 1
+        self._queue.put((func, future))
+        return future
+
+    def execute(self, func: Callable[[Session], Any]) -> Any:
+        """提交写操作并等待结果"""
+        return self.submit(func).result()
+
+    def _collect_batch(self, first: Tuple) -> Tuple[List[Tuple], bool]:
+        """以first为起点，收集聚合窗口内到达的写操作
+
+        Returns:
+            (批次, 是否收到停止信号)
+        """
+        batch = [first]
+        if not self.group_commit:
+            return batch, False
+        started = time.monotonic()
+        deadline = started + self.linger
+        stopping = False
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    item = self._queue.get(timeout=remaining)
+                else:
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                stopping = True
+                break
+            batch.append(item)
+        self.linger_ms_histogram.observe((time.monotonic() - started) * 1000)
+        return batch, stopping
+
+    def _execute_batch(self, batch: List[Tuple]) -> None:
+        """在一个事务中执行一批写操作"""
+        active = [(func, future) for func, future in batch if future.set_running_or_notify_cancel()]
+        if not active:
+            return
+        self.batch_size_histogram.observe(len(active))
+        # 只有一个操作时无需SAVEPOINT，失败直接回滚整个事务
+        use_savepoint = len(active) > 1
+        outcomes = []
+        session = self._session_factory()
+        try:
+            for func, future in active:
+                if use_savepoint:
+                    try:
+                        with session.begin_nested():
+                            outcomes.append((future, func(session), None))
+                    except Exception as e:
+                        outcomes.append((future, None, e))
+                else:
+                    outcomes.append((future, func(session), None))
+            session.commit()
+        except BaseException as e:
+            session.rollback()
+            with self._lock:
+                self._failed += len(active)
+            for _, future in active:
+                future.set_exception(e)
+            return
+        finally:
+            session.close()
+
+        with self._lock:
+            self._commits += 1
+        for future, result, error in outcomes:
+            with self._lock:
+                if error is None:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+    def _run(self) -> None:
+        """写线程主循环"""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch, stopping = self._collect_batch(item)
+            try:
+                self._execute_batch(batch)
+            except Exception as e:
+                logger.error(f"{self._name} batch failed: {e}", exc_info=True)
+            if stopping:
+                break
+        logger.debug(f"{self._name} stopped")
+
+    def stats(self) -> Dict[str, Any]:
+        """获取写队列统计信息"""
+        with self._lock:
+            stats = {
+                "queue_depth": self._queue.qsize(),
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "commits": self._commits,
+            }
+        stats["batch_size"] = self.batch_size_histogram.snapshot()
+        stats["linger_ms"] = self.linger_ms_histogram.snapshot()
+        return stats
@@ -0,0 +1,5 @@
+from .histogram import Histogram
+
+__all__ = [
+    "Histogram",
+]
@@ -0,0 +1,110 @@
+from sqlalchemy import func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Optional, List, Sequence, Set, Tuple
+from app.domains.user.repositories.user_repository import UserRepositoryInterface
+from app.domains.user.models.user import User
+from app.domains.user.schemas.user import UserUpdate
+from app.infrastructure.repositories.sqlite.pagination import keyset_select, split_page
+from app.infrastructure.repositories.sqlite.user_repository import USER_SORT_KEYS
+
+
+class AsyncSQLiteUserRepository(UserRepositoryInterface):
+    """SQLite用户仓储异步实现，接口与SQLiteUserRepository一致，方法均为协程
+
+    读操作使用传入的会话；配置了写会话时，写操作自动使用写会话执行。
+    """
+
+    def __init__(self, db: AsyncSession, write_db: Optional[AsyncSession] = None):
+        self.db = db
+        self.write_db = write_db if write_db is not None else db
+
+    async def get(self, user_id: int) -> Optional[User]:
+        """根据ID获取用户"""
+        return await self.db.get(User, user_id)
+
+    async def get_multi(self, skip: int = 0, limit: int = 100) -> List[User]:
+        """获取用户列表"""
+        result = await self.db.scalars(select(User).offset(skip).limit(limit))
+        return list(result.all())
+
+    async def get_page(
+        self,
+        limit: int = 100,
+        after: Optional[Sequence[Any]] = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> Tuple[List[User], Optional[Tuple[Any, ...]]]:
+        """基于键集分页获取用户列表"""
+        if order_by not in USER_SORT_KEYS:
+            raise ValueError(f"Unsupported sort key: {order_by}")
+        key_columns = USER_SORT_KEYS[order_by]
+        stmt = keyset_select(User, key_columns, after, limit, descending)
+        result = await self.db.scalars(stmt)
+        return split_page(list(result.all()), key_columns, limit)
+
+    async def count(self) -> int:
+        """统计用户总数"""
+        return await self.db.scalar(select(func.count()).select_from(User))
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        """根据用户名获取用户"""
+        result = await self.db.scalars(select(User).where(User.username == username).limit(1))
+        return result.first()
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """根据邮箱获取用户"""
+        result = await self.db.scalars(select(User).where(User.email == email).limit(1))
+        return result.first()
+
+    async def create(self, user_in: dict) -> User:
+        """创建用户"""
+        db_user = User(**user_in)
+        self.write_db.add(db_user)
+        await self.write_db.commit()
+        await self.write_db.refresh(db_user)
+        return db_user
+
+    async def find_existing(self, usernames: List[str], emails: List[str]) -> Tuple[Set[str], Set[str]]:
+        """批量查询已存在的用户名和邮箱"""
+        if not usernames and not emails:
+            return set(), set()
+        stmt = select(User.username, User.email).where(
+            or_(User.username.in_(usernames), User.email.in_(emails))
+        )
+        rows = (await self.db.execute(stmt)).all()
+        return (
+            {username for username, _ in rows} & set(usernames),
+            {email for _, email in rows} & set(emails),
+        )
+
+    async def bulk_create(self, users_in: List[dict]) -> List[int]:
+        """批量创建用户"""
+        if not users_in:
+            return []
+        stmt = insert(User).returning(User.id, sort_by_parameter_order=True)
+        try:
+            ids = list(await self.write_db.scalars(stmt, users_in))
+            await self.write_db.commit()
+        except Exception:
+            await self.write_db.rollback()
+            raise
+        return ids
+
+    async def update(self, user_id: int, user_in: UserUpdate) -> Optional[User]:
+        """更新用户"""
+        db_user = await self.write_db.get(User, user_id)
+        if db_user:
+            update_data = user_in.model_dump(exclude_unset=True)
+            for field, value in update_data.items():
+                setattr(db_user, field, value)
+            await self.write_db.commit()
+            await self.write_db.refresh(db_user)
+        return db_user
+
+    async def delete(self, user_id: int) -> Optional[User]:
+        """删除用户"""
+        db_user = await self.write_db.get(User, user_id)
+        if db_user:
+            await self.write_db.delete(db_user)
+            await self.write_db.commit()
+        return db_user
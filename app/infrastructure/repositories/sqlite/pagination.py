@@ -0,0 +1,63 @@
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+from sqlalchemy import DateTime, Select, String, literal, select, tuple_
+
+
+def keyset_value(value: Any) -> Any:
+    """将排序键的值转换为可序列化、且与SQLite存储格式一致的形式
+
+    SQLite没有原生时间类型，时间以文本存储并按字符串比较。服务端默认值
+    CURRENT_TIMESTAMP 不带微秒，而SQLAlchemy绑定参数总是带微秒，直接比较会出错，
+    因此按存储格式格式化时间。
+    """
+    if isinstance(value, datetime):
+        fmt = "%Y-%m-%d %H:%M:%S.%f" if value.microsecond else "%Y-%m-%d %H:%M:%S"
+        return value.strftime(fmt)
+    return value
+
+
+def _bind(column: Any, value: Any) -> Any:
+    """绑定排序键的值"""
+    if isinstance(column.type, DateTime):
+        # 时间值已按存储格式转为文本，按文本绑定
+        return literal(value, String())
+    return literal(value, column.type)
+
+
+def keyset_select(
+    model: Any,
+    key_columns: Sequence[Any],
+    after: Optional[Sequence[Any]],
+    limit: int,
+    descending: bool = False,
+) -> Select:
+    """构造键集分页查询
+
+    多出一条记录（limit + 1）用于判断是否存在下一页。
+
+    Raises:
+        ValueError: 排序键与排序字段数量不一致
+    """
+    stmt = select(model)
+    if after is not None:
+        if len(after) != len(key_columns):
+            raise ValueError("Cursor does not match the sort key")
+        bounds = [_bind(column, value) for column, value in zip(key_columns, after)]
+        if len(key_columns) == 1:
+            left, right = key_columns[0], bounds[0]
+        else:
+            left, right = tuple_(*key_columns), tuple_(*bounds)
+        stmt = stmt.where(left < right if descending else left > right)
+    order = [column.desc() if descending else column.asc() for column in key_columns]
+    return stmt.order_by(*order).limit(limit + 1)
+
+
+def split_page(
+    rows: List[Any], key_columns: Sequence[Any], limit: int
+) -> Tuple[List[Any], Optional[Tuple[Any, ...]]]:
+    """拆分查询结果为当前页和下一页排序键"""
+    if len(rows) <= limit:
+        return rows, None
+    items = rows[:limit]
+    last = items[-1]
+    return items, tuple(keyset_value(getattr(last, column.key)) for column in key_columns)
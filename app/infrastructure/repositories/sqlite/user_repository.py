@@ -1,15 +1,45 @@
+from sqlalchemy import func, insert, inspect, or_, select
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Any, Callable, Optional, List, Sequence, Set, Tuple
 from app.domains.user.repositories.user_repository import UserRepositoryInterface
 from app.domains.user.models.user import User
 from app.domains.user.schemas.user import UserCreate, UserUpdate
+from app.infrastructure.database.sqlite.writer import SQLiteWriter
+from app.infrastructure.repositories.sqlite.pagination import keyset_select, split_page
+
+# 可用的分页排序键，末尾加上主键保证排序唯一
+USER_SORT_KEYS = {
+    "id": (User.id,),
+    "created_at": (User.created_at, User.id),
+}
 
 
 class SQLiteUserRepository(UserRepositoryInterface):
-    """SQLite用户仓储实现"""
+    """SQLite用户仓储实现
+
+    读操作使用传入的会话；配置了写入器时，写操作自动提交到单写线程执行，
+    否则在当前会话中执行并提交。
+    """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, writer: Optional[SQLiteWriter] = None):
         self.db = db
+        self.writer = writer
+
+    def _write(self, func: Callable[[Session], Any]) -> Any:
+        """执行写操作"""
+        if self.writer is not None:
+            return self.writer.execute(func)
+        try:
+            result = func(self.db)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        # 提交后对象会过期，刷新以保持返回对象可直接使用
+        state = inspect(result, raiseerr=False) if result is not None else None
+        if state is not None and state.persistent:
+            self.db.refresh(result)
+        return result
 
     def get(self, user_id: int) -> Optional[User]:
         """根据ID获取用户"""
@@ -19,6 +49,24 @@ class SQLiteUserRepository(UserRepositoryInterface):
         """获取用户列表"""
         return self.db.query(User).offset(skip).limit(limit).all()
 
+    def get_page(
+        self,
+        limit: int = 100,
+        after: Optional[Sequence[Any]] = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> Tuple[List[User], Optional[Tuple[Any, ...]]]:
+        """基于键集分页获取用户列表"""
+        if order_by not in USER_SORT_KEYS:
+            raise ValueError(f"Unsupported sort key: {order_by}")
+        key_columns = USER_SORT_KEYS[order_by]
+        stmt = keyset_select(User, key_columns, after, limit, descending)
+        return split_page(list(self.db.scalars(stmt).all()), key_columns, limit)
+
+    def count(self) -> int:
+        """统计用户总数"""
+        return self.db.scalar(select(func.count()).select_from(User))
+
     def get_by_username(self, username: str) -> Optional[User]:
         """根据用户名获取用户"""
         return self.db.query(User).filter(User.username == username).first()
@@ -29,28 +77,61 @@ class SQLiteUserRepository(UserRepositoryInterface):
 
     def create(self, user_in: dict) -> User:
         """创建用户"""
-        db_user = User(**user_in)
-        self.db.add(db_user)
-        self.db.commit()
-        self.db.refresh(db_user)
-        return db_user
+        def _create(session: Session) -> User:
+            db_user = User(**user_in)
+            session.add(db_user)
+            session.flush()
+            return db_user
+
+        return self._write(_create)
+
+    def find_existing(self, usernames: List[str], emails: List[str]) -> Tuple[Set[str], Set[str]]:
+        """批量查询已存在的用户名和邮箱"""
+        if not usernames and not emails:
+            return set(), set()
+        stmt = select(User.username, User.email).where(
+            or_(User.username.in_(usernames), User.email.in_(emails))
+        )
+        rows = self.db.execute(stmt).all()
+        return (
+            {username for username, _ in rows} & set(usernames),
+            {email for _, email in rows} & set(emails),
+        )
+
+    def bulk_create(self, users_in: List[dict]) -> List[int]:
+        """批量创建用户
+
+        使用executemany一次插入整批数据，不构造ORM对象。
+        """
+        if not users_in:
+            return []
+
+        def _bulk_create(session: Session) -> List[int]:
+            stmt = insert(User).returning(User.id, sort_by_parameter_order=True)
+            return list(session.scalars(stmt, users_in))
+
+        return self._write(_bulk_create)
 
     def update(self, user_id: int, user_in: UserUpdate) -> Optional[User]:
         """更新用户"""
-        db_user = self.get(user_id)
-        if db_user:
-            update_data = user_in.model_dump(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(db_user, field, value)
-            self.db.add(db_user)
-            self.db.commit()
-            self.db.refresh(db_user)
-        return db_user
+        def _update(session: Session) -> Optional[User]:
+            db_user = session.get(User, user_id)
+            if db_user:
+                update_data = user_in.model_dump(exclude_unset=True)
+                for field, value in update_data.items():
+                    setattr(db_user, field, value)
+                session.flush()
+            return db_user
+
+        return self._write(_update)
 
     def delete(self, user_id: int) -> Optional[User]:
         """删除用户"""
-        db_user = self.get(user_id)
-        if db_user:
-            self.db.delete(db_user)
-            self.db.commit()
-        return db_user
+        def _delete(session: Session) -> Optional[User]:
+            db_user = session.get(User, user_id)
+            if db_user:
+                session.delete(db_user)
+                session.flush()
+            return db_user
+
+        return self._write(_delete)
@@ -1,2 +1,8 @@
-from app.utils.password import get_password_hash, verify_password
-from app.utils.jwt import create_access_token, decode_access_token
+from app.utils.password import (
+    get_password_hash,
+    verify_password,
+    hash_password_async,
+    verify_password_async,
+    password_hasher,
+)
+from app.utils.jwt import create_access_token, decode_access_token, verify_access_token
@@ -0,0 +1,14 @@
+import inspect
+from typing import Any, Callable
+from fastapi.concurrency import run_in_threadpool
+
+
+async def run_maybe_async(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """执行同步或异步函数
+
+    协程函数直接在事件循环中等待；同步函数（如同步仓储的阻塞数据库调用）
+    放到线程池执行，避免阻塞事件循环。用于让服务层同时兼容同步和异步仓储。
+    """
+    if inspect.iscoroutinefunction(func):
+        return await func(*args, **kwargs)
+    return await run_in_threadpool(func, *args, **kwargs)
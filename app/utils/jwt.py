@@ -1,7 +1,22 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional
 from jose import JWTError, jwt
-from app.dependencies.config import app_settings
+from app.config.settings import app_settings
+from app.infrastructure.cache.lru import TTLCache
+
+
+# 已验证令牌缓存：令牌摘要 -> 解码后的声明，条目在令牌自身的exp时刻过期
+_token_cache = TTLCache(
+    maxsize=app_settings.JWT_CACHE_SIZE,
+    ttl=app_settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+# 被拒绝令牌缓存：令牌摘要 -> 错误信息，避免重复验证无效令牌
+_rejected_token_cache = TTLCache(
+    maxsize=app_settings.JWT_NEGATIVE_CACHE_SIZE,
+    ttl=app_settings.JWT_NEGATIVE_CACHE_TTL,
+)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -16,10 +31,55 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+def _token_key(token: str) -> bytes:
+    """计算令牌摘要，作为缓存键"""
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def verify_access_token(token: str) -> dict:
+    """验证并解码访问令牌（带缓存）
+
+    同一令牌在有效期内只做一次签名验证，之后直接返回缓存的声明。
+    返回的字典为缓存共享对象，调用方不应修改。
+
+    Raises:
+        JWTError: 令牌无效或已过期
+    """
+    key = _token_key(token)
+    payload = _token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    error = _rejected_token_cache.get(key)
+    if error is not None:
+        raise JWTError(error)
+
+    try:
+        payload = jwt.decode(token, app_settings.SECRET_KEY, algorithms=[app_settings.ALGORITHM])
+    except JWTError as e:
+        _rejected_token_cache.set(key, str(e) or "Invalid token")
+        raise
+
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        # 将令牌的exp（墙上时间）换算为单调时钟的过期时刻
+        _token_cache.set(key, payload, expire_at=time.monotonic() + (exp - time.time()))
+    else:
+        _token_cache.set(key, payload)
+    return payload
+
+
 def decode_access_token(token: str) -> Optional[dict]:
     """解码访问令牌"""
     try:
-        payload = jwt.decode(token, app_settings.SECRET_KEY, algorithms=[app_settings.ALGORITHM])
-        return payload
+        return verify_access_token(token)
     except JWTError:
         return None
+
+
+def token_cache_stats() -> Dict[str, Dict[str, int]]:
+    """获取令牌缓存统计信息"""
+    return {
+        "verified": _token_cache.stats(),
+        "rejected": _rejected_token_cache.stats(),
+    }
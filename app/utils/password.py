@@ -1,5 +1,14 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
 import bcrypt
 
+from app.config.settings import app_settings
+from app.exception.http import ServiceUnavailableException
+
 
 def get_password_hash(password: str) -> str:
     """生成密码哈希值"""
@@ -20,3 +29,125 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     hashed_password_bytes = hashed_password.encode('utf-8')
     # 验证密码
     return bcrypt.checkpw(plain_password_bytes, hashed_password_bytes)
+
+
+def get_password_hashes(passwords: List[str]) -> List[str]:
+    """批量生成密码哈希值"""
+    return [get_password_hash(password) for password in passwords]
+
+
+class PasswordHasher:
+    """基于进程池的异步密码哈希器
+
+    bcrypt计算属于CPU密集型任务，放到独立进程池中执行，避免占用请求线程池。
+    排队任务数有上限，超出时直接抛出503异常，防止登录风暴拖垮其他接口。
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: int = 64):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        # 统计指标
+        self._pending = 0
+        self._peak_pending = 0
+        self._submitted = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """获取进程池，首次使用时创建"""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _acquire(self) -> None:
+        """占用一个排队名额，队列已满时快速失败"""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise ServiceUnavailableException(
+                    message="Password hashing queue is full",
+                    error_details={"pending": self._pending, "max_pending": self.max_pending},
+                )
+            self._pending += 1
+            self._submitted += 1
+            if self._pending > self._peak_pending:
+                self._peak_pending = self._pending
+
+    def _release(self) -> None:
+        """释放排队名额"""
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+
+    async def _submit(self, func: Callable[..., Any], *args: Any) -> Any:
+        """提交任务到进程池并等待结果"""
+        self._acquire()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._release()
+
+    async def hash(self, password: str) -> str:
+        """异步生成密码哈希值"""
+        return await self._submit(get_password_hash, password)
+
+    async def hash_many(self, passwords: List[str]) -> List[str]:
+        """异步批量生成密码哈希值，结果顺序与输入一致
+
+        密码按进程数切分为若干批，每批作为一个任务提交，
+        既能用满所有CPU核，又不会因大量单个任务占满排队名额或产生过多进程间通信。
+        """
+        if not passwords:
+            return []
+        size = -(-len(passwords) // self.max_workers)
+        batches = [passwords[i:i + size] for i in range(0, len(passwords), size)]
+        results = await asyncio.gather(
+            *(self._submit(get_password_hashes, batch) for batch in batches)
+        )
+        return [hashed for batch in results for hashed in batch]
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """异步验证密码"""
+        return await self._submit(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, int]:
+        """获取队列统计信息"""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "peak_pending": self._peak_pending,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """关闭进程池，下次使用时会重新创建"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+# 全局密码哈希器实例
+password_hasher = PasswordHasher(
+    max_workers=app_settings.PASSWORD_HASH_WORKERS,
+    max_pending=app_settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """异步生成密码哈希值（在进程池中执行）"""
+    return await password_hasher.hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """异步验证密码（在进程池中执行）"""
+    return await password_hasher.verify(plain_password, hashed_password)
@@ -0,0 +1,71 @@
+import csv
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Tuple
+
+# 支持的流式数据格式
+NDJSON = "ndjson"
+CSV = "csv"
+
+
+def detect_format(content_type: str) -> str:
+    """根据Content-Type判断流式数据格式，默认为NDJSON"""
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if media_type in ("text/csv", "application/csv"):
+        return CSV
+    return NDJSON
+
+
+async def aiter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """将字节流按行切分，行不会在分块边界处被截断"""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.rstrip(b"\r").decode("utf-8")
+    if buffer:
+        yield buffer.rstrip(b"\r").decode("utf-8")
+
+
+async def aiter_records(
+    chunks: AsyncIterable[bytes], fmt: str = NDJSON
+) -> AsyncIterator[Tuple[int, Any]]:
+    """将字节流解析为记录
+
+    NDJSON每行一个JSON对象；CSV首行为表头（不支持跨行的引号字段）。
+    空行会被跳过。
+
+    Yields:
+        (行号, 记录字典)，解析失败时记录为ValueError
+    """
+    header = None
+    line_no = 0
+    async for line in aiter_lines(chunks):
+        line_no += 1
+        if not line.strip():
+            continue
+        if fmt == CSV:
+            row = next(csv.reader([line]))
+            if header is None:
+                header = [name.strip() for name in row]
+                continue
+            if len(row) != len(header):
+                yield line_no, ValueError(f"Expected {len(header)} columns, got {len(row)}")
+                continue
+            yield line_no, dict(zip(header, row))
+        else:
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield line_no, ValueError(f"Invalid JSON: {e}")
+                continue
+            if not isinstance(record, dict):
+                yield line_no, ValueError("Expected a JSON object")
+                continue
+            yield line_no, record
+
+
+async def aiter_ndjson(items: AsyncIterable[Any]) -> AsyncIterator[bytes]:
+    """将对象流编码为NDJSON字节流"""
+    async for item in items:
+        yield json.dumps(item, ensure_ascii=False, default=str).encode("utf-8") + b"\n"